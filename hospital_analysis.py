@@ -2,18 +2,22 @@ import re
 from urllib.parse import urlparse
 from typing import List, Dict, Any
 
+import numpy as np
+
 from hospital_crawler import (
-    find_hospitals, 
-    crawl_hospital_website, 
+    find_hospitals,
+    crawl_hospital_website,
     setup_logging,
-    _get_city_coordinates, 
-    calculate_distance
+    _get_city_coordinates,
+    calculate_distances
 )
 
 def calculate_search_metrics(hospitals: List[Dict[str, Any]], all_prices: List[Dict[str, Any]]) -> Dict[str, Any]:
     """Calculate success metrics for the hospital price search."""
-    # Count hospitals with websites
-    hospitals_with_websites = sum(1 for hospital in hospitals if hospital.get('website'))
+    # Count hospitals with websites; binding the method once avoids the
+    # per-element attribute lookup in the generator
+    get_website = dict.get
+    hospitals_with_websites = sum(1 for hospital in hospitals if get_website(hospital, 'website'))
     
     # Count successful price discoveries
     successful_hospitals = len(all_prices)
@@ -28,26 +32,46 @@ def calculate_search_metrics(hospitals: List[Dict[str, Any]], all_prices: List[D
         "price_ranges": {}
     }
     
-    # Calculate price statistics if any prices were found
+    # Calculate price statistics if any prices were found. NumPy reductions
+    # run in one pass over a contiguous buffer instead of separate Python
+    # loops per statistic.
     if all_prices:
-        prices = [p["price"] for p in all_prices]
-        metrics["price_min"] = min(prices)
-        metrics["price_max"] = max(prices)
-        metrics["price_avg"] = sum(prices) / len(prices)
-        metrics["price_median"] = sorted(prices)[len(prices) // 2]
+        prices = np.fromiter((p["price"] for p in all_prices), dtype=np.float64, count=len(all_prices))
+        metrics["price_min"] = float(prices.min())
+        metrics["price_max"] = float(prices.max())
+        metrics["price_avg"] = float(prices.mean())
+        metrics["price_median"] = float(np.median(prices))
         metrics["price_range"] = metrics["price_max"] - metrics["price_min"]
-        metrics["price_variance"] = round(sum((p - metrics["price_avg"])**2 for p in prices) / len(prices), 2)
+        metrics["price_variance"] = round(float(prices.var()), 2)
     
     return metrics
 
-def analyze_website_structure(city, state, cpt_code, procedure_name=None):
+def _crawl_for_analysis(hospital, page_cache, max_depth, max_pages):
+    """Crawl a hospital website, or reuse pages shared across analyzers.
+
+    When page_cache is provided the site is crawled once at a depth/page
+    budget covering every analyzer (depth 3 for the structure scan, 100
+    pages for the compliance scan), and the same page list is handed to
+    each of them; without it the caller's own limits apply.
+    """
+    if page_cache is None:
+        return crawl_hospital_website(hospital['website'], max_depth=max_depth, max_pages=max_pages)
+
+    pages = page_cache.get(hospital['website'])
+    if pages is None:
+        pages = crawl_hospital_website(hospital['website'], max_depth=3, max_pages=100)
+        page_cache[hospital['website']] = pages
+    return pages
+
+def analyze_website_structure(city, state, cpt_code, procedure_name=None, hospitals=None, page_cache=None):
     """Analyze hospital website structure for pricing information accessibility."""
     output_paths = {
         "log_file": f"analysis_{city}_{state}_website_structure.log"
     }
     logger = setup_logging(output_paths["log_file"])
     
-    hospitals = find_hospitals(city, state)
+    if hospitals is None:
+        hospitals = find_hospitals(city, state)
     results = {
         "total_hospitals": len(hospitals),
         "has_website": 0,
@@ -67,7 +91,7 @@ def analyze_website_structure(city, state, cpt_code, procedure_name=None):
         
         try:
             # Crawl website to limited depth
-            pages = crawl_hospital_website(hospital['website'], max_depth=3, max_pages=20)
+            pages = _crawl_for_analysis(hospital, page_cache, max_depth=3, max_pages=20)
             
             # Check for pricing pages
             found_pricing_page = False
@@ -109,12 +133,15 @@ def analyze_website_structure(city, state, cpt_code, procedure_name=None):
         
     return results
 
-def analyze_transparency_compliance(cities_states):
+def analyze_transparency_compliance(cities_states, hospitals_by_region=None, page_cache=None):
     """Compare hospital price transparency across different regions."""
     compliance_data = {}
     
     for city, state in cities_states:
-        hospitals = find_hospitals(city, state)
+        if hospitals_by_region is not None:
+            hospitals = hospitals_by_region.get((city, state), [])
+        else:
+            hospitals = find_hospitals(city, state)
         if not hospitals:
             continue
             
@@ -135,7 +162,7 @@ def analyze_transparency_compliance(cities_states):
             
             # Check website for compliance with price transparency regulation
             compliance_score = 0
-            pages = crawl_hospital_website(hospital['website'], max_depth=2)
+            pages = _crawl_for_analysis(hospital, page_cache, max_depth=2, max_pages=100)
             
             # Look for machine-readable files (JSON, CSV, XML)
             machine_readable = any("machine" in p['text'].lower() and "readable" in p['text'].lower() 
@@ -158,9 +185,10 @@ def analyze_transparency_compliance(cities_states):
     
     return compliance_data
 
-def analyze_geographic_distribution(city, state, radius_miles=20):
+def analyze_geographic_distribution(city, state, radius_miles=20, hospitals=None):
     """Analyze geographic distribution of hospitals in an area."""
-    hospitals = find_hospitals(city, state)
+    if hospitals is None:
+        hospitals = find_hospitals(city, state)
     
     # Group by distance from city center
     distance_groups = {
@@ -175,14 +203,15 @@ def analyze_geographic_distribution(city, state, radius_miles=20):
     if not city_coords:
         return None
         
-    for hospital in hospitals:
-        if 'latitude' in hospital and 'longitude' in hospital:
-            # Calculate distance in miles
-            distance = calculate_distance(
-                city_coords['lat'], city_coords['lng'],
-                hospital['latitude'], hospital['longitude']
-            )
-            
+    # One vectorized haversine pass over every located hospital instead of
+    # per-hospital trig calls
+    located = [h for h in hospitals if 'latitude' in h and 'longitude' in h]
+    if located:
+        lats = np.fromiter((h['latitude'] for h in located), dtype=np.float64, count=len(located))
+        lons = np.fromiter((h['longitude'] for h in located), dtype=np.float64, count=len(located))
+        distances = calculate_distances(city_coords['lat'], city_coords['lng'], lats, lons)
+
+        for hospital, distance in zip(located, distances):
             # Assign to distance group
             if distance <= 5:
                 distance_groups["0-5 miles"].append(hospital)
@@ -195,12 +224,15 @@ def analyze_geographic_distribution(city, state, radius_miles=20):
     
     return distance_groups
 
-def analyze_hospital_metadata(cities_states):
+def analyze_hospital_metadata(cities_states, hospitals_by_region=None):
     """Analyze metadata about hospitals across regions."""
     metadata = {}
     
     for city, state in cities_states:
-        hospitals = find_hospitals(city, state)
+        if hospitals_by_region is not None:
+            hospitals = hospitals_by_region.get((city, state), [])
+        else:
+            hospitals = find_hospitals(city, state)
         
         # Extract metadata
         websites_count = sum(1 for h in hospitals if h.get('website'))
@@ -223,7 +255,7 @@ def analyze_hospital_metadata(cities_states):
     
     return metadata
 
-def analyze_website_content(city, state, keywords=None):
+def analyze_website_content(city, state, keywords=None, hospitals=None, page_cache=None):
     """Analyze hospital website content for specific keywords and readability."""
     if keywords is None:
         keywords = [
@@ -231,14 +263,15 @@ def analyze_website_content(city, state, keywords=None):
             "estimate", "calculator", "transparency", "charges"
         ]
     
-    hospitals = find_hospitals(city, state)
+    if hospitals is None:
+        hospitals = find_hospitals(city, state)
     results = []
     
     for hospital in hospitals:
         if not hospital.get('website'):
             continue
             
-        pages = crawl_hospital_website(hospital['website'], max_depth=2, max_pages=15)
+        pages = _crawl_for_analysis(hospital, page_cache, max_depth=2, max_pages=15)
         
         # Analyze keyword frequency
         keyword_counts = {k: 0 for k in keywords}
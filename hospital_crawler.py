@@ -1,43 +1,284 @@
+import atexit
+import functools
+import itertools
+import math
+import orjson
 import requests
 import re
 import logging
+import logging.handlers
+import queue
+import shelve
+import threading
 import time
 import random
+import xml.etree.ElementTree as ET
 from typing import List, Dict, Any, Optional
-from bs4 import BeautifulSoup
-from urllib.parse import urljoin, urlparse
-from collections import deque
+
+import numpy as np
+from bs4 import BeautifulSoup, NavigableString
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from urllib.parse import urljoin, urlparse, urlunparse
+from urllib.robotparser import RobotFileParser
 from urllib3.util.retry import Retry
 from requests.adapters import HTTPAdapter
 
+# Background listener that drains queued log records to the real handlers,
+# so logger calls in crawl loops are a cheap queue put instead of a
+# synchronous file write
+_log_listener = None
+
+def _stop_log_listener():
+    """Stop the queue listener, flushing any buffered log records."""
+    global _log_listener
+    if _log_listener is not None:
+        _log_listener.stop()
+        _log_listener = None
+
+atexit.register(_stop_log_listener)
+
+# Shared HTTP session: connection pooling keeps TCP+TLS handshakes to one
+# per host instead of one per request, which dominates on deep site crawls
+_SESSION = requests.Session()
+_RETRIES = Retry(
+    total=3,
+    backoff_factor=0.5,
+    status_forcelist=[429, 500, 502, 503, 504],
+    allowed_methods=["GET", "HEAD"]
+)
+_SESSION.mount("http://", HTTPAdapter(pool_connections=20, pool_maxsize=50, max_retries=_RETRIES))
+_SESSION.mount("https://", HTTPAdapter(pool_connections=20, pool_maxsize=50, max_retries=_RETRIES))
+
+# Terms that mark a page as pricing-related. A single compiled alternation
+# (longest match first) scans each page once instead of running one
+# substring search per keyword
+PRICE_PAGE_KEYWORDS = [
+    "price", "pricing", "cost", "charge", "fee", "rate",
+    "estimate", "financial", "bill", "payment", "transparency",
+    "patient charges", "service charges", "chargemaster",
+    "standard charges", "price list", "price transparency", "cost estimator"
+]
+_PRICE_KEYWORD_RE = re.compile('|'.join(map(re.escape, sorted(PRICE_PAGE_KEYWORDS, key=len, reverse=True))))
+
+# Phrases strong enough to keep a page even without a CPT/procedure mention
+_HIGH_CONFIDENCE_RE = re.compile('|'.join(map(re.escape, [
+    "price list", "price transparency", "chargemaster", "standard charges"
+])))
+
+# Indicator alternation and money format used by _extract_price_from_page,
+# compiled once instead of per page
+_PRICING_INDICATOR_RE = re.compile('|'.join(map(re.escape, sorted([
+    'price', 'cost', 'charge', 'fee', 'rate', 'pricing', 'estimate',
+    'transparency', 'financial'
+], key=len, reverse=True))))
+
+_MONEY_RE = re.compile(r'\$?\s?([0-9][0-9,]*(?:\.[0-9]{2})?)')
+
+# Query parameters that only carry tracking state; URLs differing solely in
+# these are the same page
+_TRACKING_PARAM_PREFIXES = ('utm_', 'fbclid', 'gclid')
+
+def _canon(url: str) -> str:
+    """Canonical form of a URL for crawl deduplication.
+
+    Drops the fragment and tracking parameters, lower-cases the host and
+    trims the trailing slash, so the alias URLs hospital CMSes emit all
+    collapse to a single visit.
+    """
+    parts = urlparse(url)
+    query = '&'.join(kv for kv in parts.query.split('&')
+                     if kv and not kv.startswith(_TRACKING_PARAM_PREFIXES))
+    return urlunparse((parts.scheme, parts.netloc.lower(),
+                       parts.path.rstrip('/') or '/', parts.params, query, ''))
+
+def _normalize_website(url: Optional[str]) -> Optional[str]:
+    """Normalize a hospital website URL once, at construction.
+
+    Adds the missing scheme OSM tags often omit, lower-cases scheme and
+    host and trims the trailing slash, so every downstream consumer
+    (domain dedup, cache keys, crawl seeds) compares equal URLs instead
+    of re-normalizing variants of the same site.
+    """
+    if not url:
+        return None
+    if not url.startswith(('http://', 'https://')):
+        url = 'https://' + url
+    parts = urlparse(url)
+    return urlunparse((parts.scheme.lower(), parts.netloc.lower(),
+                       parts.path.rstrip('/'), parts.params, parts.query, ''))
+
+# robots.txt verdicts cached per domain, so observing them costs one fetch
+# on first contact with a site rather than one per URL
+_CRAWLER_USER_AGENT = "HospitalInfoCrawler/1.0"
+_robots_cache: Dict[str, Optional[RobotFileParser]] = {}
+
+def _allowed_by_robots(url: str) -> bool:
+    """Check whether robots.txt permits fetching the URL.
+
+    The parsed robots.txt is cached per domain; an unreachable or missing
+    robots.txt is treated as allowing everything.
+    """
+    parts = urlparse(url)
+    domain = parts.netloc
+    if domain not in _robots_cache:
+        # Fetch through the shared session with a timeout; parser.read()
+        # uses urllib with no timeout and can hang a crawl worker forever
+        # on a host that accepts the connection but never responds
+        try:
+            response = _SESSION.get(f"{parts.scheme}://{domain}/robots.txt",
+                                    headers={"User-Agent": _CRAWLER_USER_AGENT},
+                                    timeout=10)
+            if response.status_code == 200:
+                parser = RobotFileParser()
+                parser.parse(response.text.splitlines())
+            else:
+                parser = None
+        except Exception:
+            parser = None
+        _robots_cache[domain] = parser
+    parser = _robots_cache[domain]
+    return True if parser is None else parser.can_fetch(_CRAWLER_USER_AGENT, url)
+
+# Politeness pacing per host: each host keeps a randomized minimum gap
+# between fetches, but fetches to different hosts never wait on each other
+_pace_lock = threading.Lock()
+_next_fetch_at: Dict[str, float] = {}
+
+def _polite_delay(host: str) -> None:
+    """Sleep just long enough to keep this host's request gap polite."""
+    gap = random.uniform(0.5, 2)
+    with _pace_lock:
+        now = time.monotonic()
+        slot = max(now, _next_fetch_at.get(host, now))
+        _next_fetch_at[host] = slot + gap
+    if slot > now:
+        time.sleep(slot - now)
+
+# URL filters for the crawl loop, built once: binary/document extensions
+# to skip and URL patterns that never lead to pricing content
+_SKIP_EXTENSIONS = ('.pdf', '.jpg', '.jpeg', '.png', '.gif', '.doc', '.docx',
+                    '.ppt', '.pptx', '.xls', '.xlsx')
+_SKIP_URL_RE = re.compile(r'(calendar|login|signin|signup|contact|feedback|search|404|403|500)',
+                          re.IGNORECASE)
+
+# Subtrees that never contain content worth scanning or following
+_NON_CONTENT_TAGS = frozenset(['script', 'style', 'meta', 'noscript', 'header', 'footer'])
+
+# Collapses runs of whitespace in one C-level pass, avoiding the token
+# list that split()/join() builds for every page
+_WS_RE = re.compile(r'\s+')
+
+# Pages larger than this are never content pages worth scanning; the cap
+# also bounds memory when a link turns out to be a huge brochure download
+_MAX_PAGE_BYTES = 5_000_000
+
+@functools.lru_cache(maxsize=32)
+def _search_term_pattern(cpt_code: str, procedure_name: Optional[str]):
+    """Compiled whole-word alternation for a CPT code and procedure name."""
+    terms = [re.escape(cpt_code)]
+    if procedure_name:
+        terms.append(re.escape(procedure_name))
+    return re.compile(r'\b(?:' + '|'.join(terms) + r')\b')
+
+class _CachedTimeFormatter(logging.Formatter):
+    """Formatter that reuses the asctime string within the same second.
+
+    Records emitted in the same second share one strftime/localtime call
+    instead of paying for the conversion per record.
+    """
+    _last_sec = None
+    _last_str = ''
+
+    def formatTime(self, record, datefmt=None):
+        sec = int(record.created)
+        if sec != self._last_sec:
+            self._last_sec = sec
+            self._last_str = time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(sec))
+        return f"{self._last_str},{int(record.msecs):03d}"
+
 def setup_logging(log_file="hospital_finder.log"):
     """Setup logging configuration"""
-    logging.basicConfig(
-        level=logging.INFO,
-        format='%(asctime)s - %(levelname)s - %(message)s',
-        handlers=[
-            logging.FileHandler(log_file),
-            logging.StreamHandler()  # Also output to console
-        ]
+    global _log_listener
+    _stop_log_listener()
+
+    formatter = _CachedTimeFormatter('%(asctime)s - %(levelname)s - %(message)s')
+    file_handler = logging.FileHandler(log_file)
+    file_handler.setFormatter(formatter)
+    stream_handler = logging.StreamHandler()  # Also output to console
+    stream_handler.setFormatter(formatter)
+
+    log_queue = queue.Queue(-1)
+    root = logging.getLogger()
+    root.setLevel(logging.INFO)
+    root.handlers.clear()
+    root.addHandler(logging.handlers.QueueHandler(log_queue))
+
+    _log_listener = logging.handlers.QueueListener(
+        log_queue, file_handler, stream_handler
     )
+    _log_listener.start()
+
     return logging.getLogger(__name__)
 
 def find_hospitals(city: str, state: str, limit: int = 10) -> List[Dict[str, Any]]:
-    """Find hospitals in a specified city and state."""
+    """Find hospitals in a specified city and state.
+
+    Results are memoized per (city, state, limit), so the different
+    analyzers that look up the same region don't repeat the geocoding and
+    Overpass round trips.
+    """
+    return _find_hospitals_cached(city.strip(), state.strip().upper(), limit)
+
+@functools.lru_cache(maxsize=128)
+def _find_hospitals_cached(city: str, state: str, limit: int) -> List[Dict[str, Any]]:
     city_coordinates = _get_city_coordinates(city, state)
     if not city_coordinates:
         return []
-    
+
     hospitals = _find_nearby_hospitals(
         city_coordinates["lat"],
         city_coordinates["lng"],
         limit
     )
-    
+
     return hospitals
 
 def _get_city_coordinates(city: str, state: str) -> Optional[Dict[str, float]]:
-    """Get the latitude and longitude coordinates for a city."""
+    """Get the latitude and longitude coordinates for a city.
+
+    Results are memoized on the normalized pair so repeat lookups of the
+    same metro skip the Nominatim round trip.
+    """
+    return _geocode_cached(city.strip().lower(), state.strip().upper())
+
+# City coordinates barely change, so geocodes persist on disk between runs
+# alongside the in-process lru_cache
+_GEOCODE_CACHE_FILE = ".geocode_cache"
+_GEOCODE_TTL_SECONDS = 30 * 24 * 3600
+
+@functools.lru_cache(maxsize=1024)
+def _geocode_cached(city: str, state: str) -> Optional[Dict[str, float]]:
+    cache_key = f"{city}:{state}"
+    try:
+        with shelve.open(_GEOCODE_CACHE_FILE) as cache:
+            entry = cache.get(cache_key)
+            if entry and time.time() - entry["timestamp"] < _GEOCODE_TTL_SECONDS:
+                return entry["coords"]
+    except Exception as e:
+        logging.getLogger(__name__).warning(f"Error reading geocode cache: {e}")
+
+    coords = _query_nominatim(city, state)
+
+    if coords:
+        try:
+            with shelve.open(_GEOCODE_CACHE_FILE) as cache:
+                cache[cache_key] = {"timestamp": time.time(), "coords": coords}
+        except Exception as e:
+            logging.getLogger(__name__).warning(f"Error writing geocode cache: {e}")
+
+    return coords
+
+def _query_nominatim(city: str, state: str) -> Optional[Dict[str, float]]:
     try:
         base_url = "https://nominatim.openstreetmap.org/search"
         params = {
@@ -52,10 +293,10 @@ def _get_city_coordinates(city: str, state: str) -> Optional[Dict[str, float]]:
             "User-Agent": "HospitalFinderApp/1.0"
         }
         
-        response = requests.get(base_url, params=params, headers=headers)
+        response = _SESSION.get(base_url, params=params, headers=headers)
         response.raise_for_status()
         
-        results = response.json()
+        results = orjson.loads(response.content)
         if results:
             return {
                 "lat": float(results[0]["lat"]),
@@ -64,66 +305,240 @@ def _get_city_coordinates(city: str, state: str) -> Optional[Dict[str, float]]:
         return None
     
     except Exception as e:
-        print(f"Error getting coordinates for {city}, {state}: {e}")
+        logging.getLogger(__name__).error(f"Error getting coordinates for {city}, {state}: {e}")
         return None
 
+# Pricing search results cached on disk: hospitals publish charge files
+# quarterly, so a week-old answer for the same (domain, code, procedure)
+# is still current and saves a full site crawl. The lock serializes shelve
+# access from the concurrent per-hospital searches
+_PRICING_CACHE_FILE = ".pricing_cache"
+_PRICING_TTL_SECONDS = 7 * 24 * 3600
+_pricing_cache_lock = threading.Lock()
+
+# Overpass responses cached on disk: the API routinely takes seconds per
+# query and rate-limits aggressively, while hospital locations barely change
+_OVERPASS_CACHE_FILE = ".overpass_cache"
+_OVERPASS_TTL_SECONDS = 7 * 24 * 3600
+
 def _find_nearby_hospitals(lat: float, lng: float, limit: int = 10) -> List[Dict[str, Any]]:
-    """Find hospitals near the specified coordinates."""
+    """Find hospitals near the specified coordinates.
+
+    Overpass results are cached on disk for a week, keyed on the rounded
+    coordinates, so repeat runs over the same area skip the query.
+    """
+    cache_key = f"{round(lat, 3)}:{round(lng, 3)}:{limit}"
+    try:
+        with shelve.open(_OVERPASS_CACHE_FILE) as cache:
+            entry = cache.get(cache_key)
+            if entry and time.time() - entry["timestamp"] < _OVERPASS_TTL_SECONDS:
+                return entry["hospitals"]
+    except Exception as e:
+        logging.getLogger(__name__).warning(f"Error reading Overpass cache: {e}")
+
+    hospitals = _query_overpass_hospitals(lat, lng, limit)
+
+    if hospitals:
+        try:
+            with shelve.open(_OVERPASS_CACHE_FILE) as cache:
+                cache[cache_key] = {"timestamp": time.time(), "hospitals": hospitals}
+        except Exception as e:
+            logging.getLogger(__name__).warning(f"Error writing Overpass cache: {e}")
+
+    return hospitals
+
+def _query_overpass_hospitals(lat: float, lng: float, limit: int) -> List[Dict[str, Any]]:
     try:
-        # Query to find hospitals within approximately 30km radius
+        # Query to find hospitals within approximately 30km radius. Ways and
+        # relations are unioned in alongside nodes so campuses mapped as
+        # building outlines show up in the same single round trip; "out
+        # center" makes Overpass return a representative coordinate for them
         query = f"""
         [out:json];
         (
           node["amenity"="hospital"](around:30000,{lat},{lng});
           node["healthcare"="hospital"](around:30000,{lat},{lng});
           node["building"="hospital"](around:30000,{lat},{lng});
+          way["amenity"="hospital"](around:30000,{lat},{lng});
+          way["healthcare"="hospital"](around:30000,{lat},{lng});
+          relation["amenity"="hospital"](around:30000,{lat},{lng});
         );
-        out body {limit};
+        out center {limit};
         """
         
         overpass_url = "https://overpass-api.de/api/interpreter"
-        response = requests.post(overpass_url, data={"data": query})
+        response = _SESSION.post(overpass_url, data={"data": query})
         response.raise_for_status()
-        results = response.json()
+        results = orjson.loads(response.content)
         
+        # Nodes carry coordinates directly; ways and relations get a
+        # representative point from "out center". Filtering first and
+        # slicing to the limit stops parsing as soon as enough usable
+        # elements have been seen
+        usable = ((element, element["lat"], element["lon"]) if element["type"] == "node"
+                  else (element, element["center"]["lat"], element["center"]["lon"])
+                  for element in results.get("elements", [])
+                  if element["type"] == "node" or element.get("center"))
+
         hospitals = []
-        for element in results.get("elements", []):
-            if element["type"] == "node":
-                tags = element.get("tags", {})
-                hospital_name = tags.get("name", "Unknown Hospital")
-                
-                # Format address
-                address_parts = []
-                if "addr:housenumber" in tags and "addr:street" in tags:
-                    address_parts.append(f"{tags['addr:housenumber']} {tags['addr:street']}")
-                elif "addr:street" in tags:
-                    address_parts.append(tags["addr:street"])
-                
-                if "addr:city" in tags:
-                    address_parts.append(tags["addr:city"])
-                
-                if "addr:postcode" in tags:
-                    address_parts.append(tags["addr:postcode"])
-                
-                address = ", ".join(address_parts) if address_parts else "Address unknown"
-                
-                hospitals.append({
-                    "name": hospital_name,
-                    "address": address,
-                    "latitude": element["lat"],
-                    "longitude": element["lon"],
-                    "phone": tags.get("phone", None),
-                    "website": tags.get("website", None),
-                })
-                
-        return hospitals[:limit]
+        for element, latitude, longitude in itertools.islice(usable, limit):
+            tags = element.get("tags", {})
+            hospital_name = tags.get("name", "Unknown Hospital")
+            
+            # Format address
+            address_parts = []
+            if "addr:housenumber" in tags and "addr:street" in tags:
+                address_parts.append(f"{tags['addr:housenumber']} {tags['addr:street']}")
+            elif "addr:street" in tags:
+                address_parts.append(tags["addr:street"])
+            
+            if "addr:city" in tags:
+                address_parts.append(tags["addr:city"])
+            
+            if "addr:postcode" in tags:
+                address_parts.append(tags["addr:postcode"])
+            
+            address = ", ".join(address_parts) if address_parts else "Address unknown"
+            
+            hospitals.append({
+                "name": hospital_name,
+                "address": address,
+                "latitude": latitude,
+                "longitude": longitude,
+                "phone": tags.get("phone", None),
+                "website": _normalize_website(tags.get("website")),
+            })
+
+        return hospitals
     
     except Exception as e:
-        print(f"Error finding hospitals: {e}")
+        logging.getLogger(__name__).error(f"Error finding hospitals: {e}")
         return []
 
-def crawl_hospital_website(url: str, max_depth: int = 3, max_pages: int = 100) -> List[Dict[str, Any]]:
-    """Crawl a hospital website using BFS up to a specified depth."""
+def _fetch_page(headers, current_url, depth, domain, collect_links):
+    """Fetch and parse one page for the crawler.
+
+    Returns (page, links) where page is None for skipped or failed URLs.
+    Safe to run from worker threads; each worker applies its own polite
+    delay before fetching.
+    """
+    logger = logging.getLogger(__name__)
+    
+    try:
+        # Skip non-HTML resources
+        if current_url.lower().endswith(_SKIP_EXTENSIONS):
+            return None, []
+        
+        # Skip certain URL patterns
+        if _SKIP_URL_RE.search(current_url):
+            return None, []
+        
+        # Respect robots.txt; disallowed URLs are not worth a fetch or the
+        # risk of getting the crawler banned
+        if not _allowed_by_robots(current_url):
+            logger.debug("Skipping URL disallowed by robots.txt: %s", current_url)
+            return None, []
+        
+        # Reserve this host's next polite fetch slot; URLs skipped above no
+        # longer pay any delay at all
+        _polite_delay(domain)
+        
+        # Fetch page headers first; stream=True defers the body download
+        logger.debug("Fetching: %s", current_url)
+        response = _SESSION.get(current_url, headers=headers, timeout=15, stream=True)
+        response.raise_for_status()
+        
+        # Bail on the headers alone when the body is not worth downloading:
+        # wrong content type, or far too large to be a content page
+        content_type = response.headers.get('Content-Type', '').lower()
+        if 'text/html' not in content_type:
+            logger.debug("Skipping non-HTML content: %s (%s)", current_url, content_type)
+            response.close()
+            return None, []
+        
+        content_length = int(response.headers.get('Content-Length') or 0)
+        if content_length > _MAX_PAGE_BYTES:
+            logger.debug("Skipping oversized page: %s (%s bytes)", current_url, content_length)
+            response.close()
+            return None, []
+        
+        # Read at most the cap even when no Content-Length header was sent
+        body = response.raw.read(_MAX_PAGE_BYTES, decode_content=True)
+        response.close()
+        
+        # Parse HTML
+        soup = BeautifulSoup(body.decode(response.encoding or 'utf-8', errors='replace'), 'lxml')
+        
+        # Extract page information
+        # get_text handles titles with nested markup, where .string is None
+        title = soup.title.get_text(strip=True) if soup.title else "No title"
+        
+        # Walk the tree once, collecting text and anchors together while
+        # skipping script/style/nav subtrees - one traversal instead of a
+        # decompose pass plus separate get_text and find_all passes
+        text_parts = []
+        anchor_elements = []
+        stack = list(reversed(soup.contents))
+        while stack:
+            node = stack.pop()
+            if isinstance(node, NavigableString):
+                stripped = node.strip()
+                if stripped:
+                    text_parts.append(stripped)
+                continue
+            if node.name in _NON_CONTENT_TAGS:
+                continue
+            if node.name == 'a' and node.has_attr('href'):
+                anchor_elements.append(node)
+            stack.extend(reversed(node.contents))
+        
+        text_content = _WS_RE.sub(' ', ' '.join(text_parts))
+        
+        # Record every anchor while the tree is in hand, so later passes
+        # (PDF discovery) can reuse them without re-downloading the page;
+        # same-domain links for the BFS come out of the same walk
+        anchors = []
+        links = []
+        for link in anchor_elements:
+            href = link['href']
+            
+            if href.startswith(('#', 'javascript:', 'mailto:', 'tel:')):
+                continue
+            
+            full_url = urljoin(current_url, href)
+            link_text = link.get_text(strip=True).lower()
+            anchors.append((full_url, link_text))
+            
+            if collect_links:
+                candidate = _canon(full_url)
+                if urlparse(candidate).netloc == domain:
+                    # Links whose URL or anchor text mentions pricing get
+                    # fetched ahead of the rest of their level
+                    priority = 0 if (_PRICE_KEYWORD_RE.search(candidate.lower())
+                                     or _PRICE_KEYWORD_RE.search(link_text)) else 1
+                    links.append((priority, candidate))
+        
+        return {
+            'url': current_url,
+            'title': title,
+            'text': text_content,
+            'text_lower': text_content.lower(),
+            'depth': depth,
+            'anchors': anchors
+        }, links
+    
+    except Exception as e:
+        logger.warning("Error processing %s: %s", current_url, e)
+        return None, []
+
+def crawl_hospital_website(url: str, max_depth: int = 3, max_pages: int = 100,
+                           page_callback=None) -> List[Dict[str, Any]]:
+    """Crawl a hospital website using BFS up to a specified depth.
+
+    page_callback, when given, is called with each crawled page; returning
+    True stops the crawl early, leaving the pages fetched so far in the
+    result list.
+    """
     if not url:
         return []
     
@@ -134,23 +549,12 @@ def crawl_hospital_website(url: str, max_depth: int = 3, max_pages: int = 100) -
         url = 'https://' + url
     
     try:
+        url = _canon(url)
         domain = urlparse(url).netloc
-        queue = deque([(url, 0)])  # (url, depth)
         visited = set([url])
         results = []
         page_count = 0
         
-        # Create a session with retry capability
-        session = requests.Session()
-        retries = Retry(
-            total=3,
-            backoff_factor=0.5,
-            status_forcelist=[429, 500, 502, 503, 504],
-            allowed_methods=["GET", "HEAD"]
-        )
-        session.mount("http://", HTTPAdapter(max_retries=retries))
-        session.mount("https://", HTTPAdapter(max_retries=retries))
-        
         headers = {
             "User-Agent": random.choice([
                 "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36",
@@ -161,80 +565,51 @@ def crawl_hospital_website(url: str, max_depth: int = 3, max_pages: int = 100) -
             "Accept-Language": "en-US,en;q=0.5"
         }
         
-        while queue and page_count < max_pages:
-            current_url, depth = queue.popleft()
-            
-            if depth > max_depth:
-                continue
-            
-            try:
-                # Add random delay to be respectful
-                time.sleep(random.uniform(0.5, 2))
-                
-                # Skip non-HTML resources
-                if any(current_url.lower().endswith(ext) for ext in ['.pdf', '.jpg', '.jpeg', '.png', '.gif', '.doc', '.docx', '.ppt', '.pptx', '.xls', '.xlsx']):
-                    continue
-                
-                # Skip certain URL patterns
-                if re.search(r'(calendar|login|signin|signup|contact|feedback|search|404|403|500)', current_url, re.IGNORECASE):
-                    continue
-                
-                # Fetch page content
-                logger.debug(f"Fetching: {current_url}")
-                response = session.get(current_url, headers=headers, timeout=15)
-                response.raise_for_status()
-                
-                # Check if it's actually HTML
-                content_type = response.headers.get('Content-Type', '').lower()
-                if 'text/html' not in content_type:
-                    logger.debug(f"Skipping non-HTML content: {current_url} ({content_type})")
-                    continue
-                
-                # Parse HTML
-                soup = BeautifulSoup(response.text, 'html.parser')
-                
-                # Extract page information
-                title = soup.title.string.strip() if soup.title else "No title"
-                
-                # Remove script, style, and other non-content elements
-                for element in soup.find_all(['script', 'style', 'meta', 'noscript', 'header', 'footer']):
-                    element.decompose()
-                
-                # Extract text content and clean it
-                text_content = soup.get_text(separator=' ', strip=True)
-                text_content = ' '.join(text_content.split())
-                
-                # Add page info to results
-                results.append({
-                    'url': current_url,
-                    'title': title,
-                    'text': text_content,
-                    'depth': depth
-                })
-                
-                page_count += 1
-                logger.info(f"Crawled {page_count}/{max_pages} pages: {current_url}")
-                
-                # Find links if not at max depth
-                if depth < max_depth:
-                    for link in soup.find_all('a', href=True):
-                        href = link['href']
-                        
-                        if href.startswith(('#', 'javascript:', 'mailto:', 'tel:')):
+        # Fetch each BFS level concurrently: pages within a level are
+        # independent, so a few in-flight requests overlap their latency
+        # while the per-worker delay keeps the request rate polite. Each
+        # level is processed best-first, so when the page budget truncates
+        # a level the likely-pricing URLs are the ones that got fetched
+        frontier = [(0, url, 0)]  # (priority, url, depth)
+        stop = False
+        with ThreadPoolExecutor(max_workers=5) as executor:
+            while frontier and page_count < max_pages and not stop:
+                frontier.sort(key=lambda entry: entry[0])
+                next_frontier = []
+                index = 0
+                while index < len(frontier) and page_count < max_pages and not stop:
+                    batch = frontier[index:index + (max_pages - page_count)]
+                    index += len(batch)
+                    
+                    futures = [
+                        executor.submit(_fetch_page, headers, current_url, depth, domain, depth < max_depth)
+                        for _, current_url, depth in batch
+                    ]
+                    for future in futures:
+                        page, links = future.result()
+                        if page is None:
                             continue
                         
-                        full_url = urljoin(current_url, href)
+                        results.append(page)
+                        page_count += 1
+                        # One progress record per ten pages keeps the log
+                        # readable on big crawls; per-page detail stays at
+                        # debug level
+                        logger.debug("Crawled page: %s", page['url'])
+                        if page_count % 10 == 0 or page_count == max_pages:
+                            logger.info("Crawled %d/%d pages", page_count, max_pages)
                         
-                        if urlparse(full_url).netloc != domain:
-                            continue
+                        if page_callback is not None and page_callback(page):
+                            logger.info("Stopping crawl early after %s", page['url'])
+                            stop = True
+                            continue  # drain remaining in-flight futures
                         
-                        if full_url not in visited:
-                            visited.add(full_url)
-                            queue.append((full_url, depth + 1))
+                        for priority, full_url in links:
+                            if full_url not in visited:
+                                visited.add(full_url)
+                                next_frontier.append((priority, full_url, page['depth'] + 1))
                 
-            except Exception as e:
-                logger.warning(f"Error processing {current_url}: {e}")
-                continue
+                frontier = next_frontier
         
         logger.info(f"Crawl completed. Visited {len(visited)} URLs, extracted content from {len(results)} pages")
         return results
@@ -244,82 +619,173 @@ def crawl_hospital_website(url: str, max_depth: int = 3, max_pages: int = 100) -
         return []
 
 def find_procedure_pricing(url: str, cpt_code: str, procedure_name: str = None, max_depth: int = 3) -> Dict[str, Any]:
-    """Search a hospital website for pricing information related to a specific CPT code."""
-    logger = logging.getLogger(__name__)
-    
+    """Search a hospital website for pricing information related to a specific CPT code.
+
+    Results are cached on disk per (domain, CPT code, procedure name) for a
+    week, so rerunning the CLI or hitting the same chain in another city
+    skips the crawl entirely.
+    """
     if not url:
         return {"found": False, "price": None, "currency": "USD", "source_url": None, "context": None}
-    
-    # Enhanced terms to look for that might indicate pricing information
-    price_page_keywords = [
-        "price", "pricing", "cost", "charge", "fee", "rate", 
-        "estimate", "financial", "bill", "payment", "transparency",
-        "patient charges", "service charges", "chargemaster",
-        "standard charges", "price list", "price transparency", "cost estimator"
-    ]
-    
-    # Common URLs for hospital pricing pages
-    transparency_urls = [
-        "/pricing", "/prices", "/chargemaster", "/charges", "/price-transparency",
-        "/standard-charges", "/patient-financial", "/cost-estimator", "/billing"
-    ]
-    
+
+    netloc = urlparse(url if url.startswith(('http://', 'https://')) else 'https://' + url).netloc.lower()
+    cache_key = f"{netloc}:{cpt_code}:{procedure_name or ''}"
+
+    try:
+        with _pricing_cache_lock, shelve.open(_PRICING_CACHE_FILE) as cache:
+            entry = cache.get(cache_key)
+            if entry and time.time() - entry["timestamp"] < _PRICING_TTL_SECONDS:
+                return entry["result"]
+    except Exception as e:
+        logging.getLogger(__name__).warning(f"Error reading pricing cache: {e}")
+
+    result, pages_seen = _search_procedure_pricing(url, cpt_code, procedure_name, max_depth)
+
+    # A search that fetched no pages at all is an outage, not a negative
+    # finding; caching it would pin "no price" for a week after a
+    # transient failure. Genuine searched-and-found-nothing results
+    # (pages seen, nothing extracted) are still cached.
+    if result["found"] or pages_seen:
+        try:
+            with _pricing_cache_lock, shelve.open(_PRICING_CACHE_FILE) as cache:
+                cache[cache_key] = {"timestamp": time.time(), "result": result}
+        except Exception as e:
+            logging.getLogger(__name__).warning(f"Error writing pricing cache: {e}")
+
+    return result
+
+# Common paths for hospital pricing pages, probed when a site has no
+# sitemap; a module-level tuple so the list isn't rebuilt per hospital
+_TRANSPARENCY_PATHS = (
+    "/pricing", "/prices", "/chargemaster", "/charges", "/price-transparency",
+    "/standard-charges", "/patient-financial", "/cost-estimator", "/billing"
+)
+
+@functools.lru_cache(maxsize=128)
+def _sitemap_pricing_urls(base_url: str) -> tuple:
+    """Pricing-related URLs listed in a site's sitemap.xml.
+
+    Returns the <loc> entries whose URL mentions a pricing keyword, or an
+    empty tuple when the sitemap is missing or unparseable. Cached per
+    site, so the probe costs one request however many procedures are
+    searched against the same hospital.
+    """
+    try:
+        response = _SESSION.get(urljoin(base_url, '/sitemap.xml'),
+                                headers={"User-Agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7)"},
+                                timeout=10)
+        if response.status_code != 200 or len(response.content) > _MAX_PAGE_BYTES:
+            return ()
+        root = ET.fromstring(response.content)
+    except Exception:
+        return ()
+
+    urls = []
+    for element in root.iter():
+        if element.tag.endswith('loc'):
+            candidate = (element.text or '').strip()
+            if candidate and _PRICE_KEYWORD_RE.search(candidate.lower()):
+                urls.append(candidate)
+    return tuple(urls[:10])
+
+def _probe_pricing_url(direct_url: str, cpt_code: str, procedure_name: str) -> Optional[Dict[str, Any]]:
+    """Fetch one candidate pricing URL and extract a price if it has one.
+
+    Returns the price info dict on success, None when the page is missing,
+    unrelated to pricing, or carries no extractable price.
+    """
+    logger = logging.getLogger(__name__)
+    try:
+        logger.info("Directly checking potential pricing page: %s", direct_url)
+
+        response = _SESSION.get(direct_url,
+                                headers={"User-Agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7)"},
+                                timeout=10)
+
+        if response.status_code != 200:
+            return None
+
+        soup = BeautifulSoup(response.text, 'lxml')
+
+        # Remove non-content elements
+        for element in soup.find_all(['script', 'style', 'meta', 'noscript']):
+            element.decompose()
+
+        text = soup.get_text(separator=' ', strip=True).lower()
+
+        # Check if this page contains pricing info and the CPT code
+        if not _PRICE_KEYWORD_RE.search(text):
+            return None
+
+        logger.info("Found potential pricing page: %s", direct_url)
+        page_info = {
+            'url': direct_url,
+            'title': soup.title.get_text(strip=True) if soup.title else "No title",
+            'text': text,
+            'text_lower': text,
+            'depth': 0
+        }
+
+        price_info = _extract_price_from_page(page_info, cpt_code, procedure_name)
+        if price_info["found"]:
+            return price_info
+    except Exception:
+        pass
+    return None
+
+def _search_procedure_pricing(url: str, cpt_code: str, procedure_name: str,
+                              max_depth: int) -> tuple[Dict[str, Any], int]:
+    """Run the uncached pricing search.
+
+    Returns the result dict plus the number of pages the search actually
+    fetched, so the caching wrapper can tell an unreachable site apart
+    from a site that was searched and had no price.
+    """
+    logger = logging.getLogger(__name__)
+
     # Normalize the starting URL
     if not url.startswith(('http://', 'https://')):
         url = 'https://' + url
         
-    base_url = f"{urlparse(url).scheme}://{urlparse(url).netloc}"
-    
-    # First try directly accessing common pricing URLs
-    for path in transparency_urls:
-        try:
-            direct_url = urljoin(base_url, path)
-            logger.info(f"Directly checking potential pricing page: {direct_url}")
-            
-            response = requests.get(direct_url, 
-                                  headers={"User-Agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7)"}, 
-                                  timeout=10)
-            
-            if response.status_code == 200:
-                soup = BeautifulSoup(response.text, 'html.parser')
-                
-                # Remove non-content elements
-                for element in soup.find_all(['script', 'style', 'meta', 'noscript']):
-                    element.decompose()
-                
-                text = soup.get_text(separator=' ', strip=True).lower()
-                
-                # Check if this page contains pricing info and the CPT code
-                if any(keyword in text for keyword in price_page_keywords):
-                    logger.info(f"Found potential pricing page: {direct_url}")
-                    page_info = {
-                        'url': direct_url,
-                        'title': soup.title.string if soup.title else "No title",
-                        'text': text,
-                        'depth': 0
-                    }
-                    
-                    # Check for pricing on this specific page
-                    price_info = _extract_price_from_page(page_info, cpt_code, procedure_name)
-                    if price_info["found"]:
-                        return price_info
-        except Exception:
-            pass
-    
-    # Crawl the website focusing on pages likely to contain pricing
+    parsed = urlparse(url)
+    base_url = f"{parsed.scheme}://{parsed.netloc}"
+
+    # Pricing URLs taken from the site's own sitemap are real pages; the
+    # speculative common paths (mostly 404s) are only probed when no
+    # sitemap is available
+    probe_urls = (list(_sitemap_pricing_urls(base_url))
+                  or [urljoin(base_url, path) for path in _TRANSPARENCY_PATHS])
+
+    # Probe the candidate pricing URLs concurrently instead of serially;
+    # the first probe that yields a price wins and the rest are cancelled
+    executor = ThreadPoolExecutor(max_workers=min(5, len(probe_urls)))
+    try:
+        futures = [executor.submit(_probe_pricing_url, direct_url, cpt_code, procedure_name)
+                   for direct_url in probe_urls]
+        for future in as_completed(futures):
+            price_info = future.result()
+            if price_info is not None:
+                return price_info, 1
+    finally:
+        executor.shutdown(wait=False, cancel_futures=True)
+
+    # Crawl the website, checking each page for pricing as it arrives so
+    # the crawl stops on the first page that yields a price instead of
+    # finishing its full budget first
     logger.info(f"Starting website crawl: {url}")
-    pages = crawl_hospital_website(url, max_depth=max_depth, max_pages=30)
-    relevant_pages = []
+    price_result = {}
     
-    # Find pages likely to contain pricing information
-    for page in pages:
-        page_text = page['text'].lower()
+    def _check_page(page):
+        # Lowered once at fetch time; the same string is reused by the
+        # extraction pass instead of re-casting the full page text
+        page_text = page.setdefault('text_lower', page['text'].lower())
         page_title = page['title'].lower()
         page_url = page['url'].lower()
         
         # Check if page has pricing-related terms
-        is_pricing_page = any(keyword in page_text or keyword in page_title or keyword in page_url 
-                            for keyword in price_page_keywords)
+        is_pricing_page = bool(_PRICE_KEYWORD_RE.search(page_text)
+                               or _PRICE_KEYWORD_RE.search(page_title)
+                               or _PRICE_KEYWORD_RE.search(page_url))
         
         # Check if page has the CPT code
         has_cpt_code = cpt_code in page_text
@@ -328,22 +794,26 @@ def find_procedure_pricing(url: str, cpt_code: str, procedure_name: str = None,
         has_procedure_name = True
         if procedure_name:
             has_procedure_name = procedure_name.lower() in page_text
-            
-        # Prioritize pages with pricing terms and either CPT code or procedure name
-        if is_pricing_page and (has_cpt_code or has_procedure_name):
-            relevant_pages.append(page)
-        # Also add pages that VERY likely contain pricing even without specific mention
-        elif any(term in page_text for term in ["price list", "price transparency", "chargemaster", "standard charges"]):
-            relevant_pages.append(page)
-    
-    logger.info(f"Found {len(relevant_pages)} pages that might contain pricing information")
-    
-    # Process relevant pages to extract pricing information
-    for page in relevant_pages:
+        
+        # Only pages with pricing terms plus the CPT code or procedure name
+        # are worth extracting from - or pages that VERY likely contain
+        # pricing even without a specific mention
+        relevant = ((is_pricing_page and (has_cpt_code or has_procedure_name))
+                    or _HIGH_CONFIDENCE_RE.search(page_text))
+        if not relevant:
+            return False
+        
         price_info = _extract_price_from_page(page, cpt_code, procedure_name)
         if price_info["found"]:
-            return price_info
+            price_result.update(price_info)
+            return True
+        return False
     
+    pages = crawl_hospital_website(url, max_depth=max_depth, max_pages=30, page_callback=_check_page)
+
+    if price_result:
+        return price_result, len(pages)
+
     # Look for PDF links if no specific pricing found
     pdf_links = _find_pdf_pricing_resources(pages, cpt_code, procedure_name)
     if pdf_links:
@@ -354,9 +824,9 @@ def find_procedure_pricing(url: str, cpt_code: str, procedure_name: str = None,
             "source_url": None,
             "context": f"Pricing information might be available in these documents: {', '.join(pdf_links[:3])}",
             "pdf_links": pdf_links
-        }
-            
-    return {"found": False, "price": None, "currency": "USD", "source_url": None, "context": None}
+        }, len(pages)
+
+    return {"found": False, "price": None, "currency": "USD", "source_url": None, "context": None}, len(pages)
 
 def _extract_price_from_page(page: Dict[str, Any], cpt_code: str, procedure_name: str = None) -> Dict[str, Any]:
     """Extract price information from a page for a specific CPT code and procedure."""
@@ -369,82 +839,61 @@ def _extract_price_from_page(page: Dict[str, Any], cpt_code: str, procedure_name
         "context": None
     }
     
-    text = page['text'].lower()
+    text = page.setdefault('text_lower', page['text'].lower())
     url = page['url'].lower()
-    
+
+    # Nothing to anchor a context window on: a plain substring scan is far
+    # cheaper than the regex work below and rules out most crawled pages
+    if cpt_code not in text and (not procedure_name or procedure_name.lower() not in text):
+        return result
+
     # Check if this page is likely to contain pricing information
-    pricing_indicators = [
-        'price', 'cost', 'charge', 'fee', 'rate', 'pricing', 'estimate',
-        'transparency', 'financial'
-    ]
-    
-    is_pricing_page = any(indicator in text or indicator in url for indicator in pricing_indicators)
-    if not is_pricing_page:
+    if not (_PRICING_INDICATOR_RE.search(text) or _PRICING_INDICATOR_RE.search(url)):
         return result
     
-    # Prepare search terms
-    cpt_code_pattern = re.compile(r'\b' + re.escape(cpt_code) + r'\b')
+    # Collect windows around CPT code and procedure name mentions in one
+    # scan, then merge the overlapping ones: price lists repeat codes next
+    # to procedure names, and merging keeps each stretch of text from being
+    # rescanned once per mention
+    pattern = _search_term_pattern(cpt_code, procedure_name.lower() if procedure_name else None)
+    spans = [(max(0, match.start() - 500), min(len(text), match.end() + 500))
+             for match in pattern.finditer(text)]
     
-    # Create text windows around CPT code mentions
-    cpt_positions = []
-    for match in cpt_code_pattern.finditer(text):
-        start_pos = max(0, match.start() - 500)
-        end_pos = min(len(text), match.end() + 500)
-        window = text[start_pos:end_pos]
-        cpt_positions.append((window, start_pos, end_pos))
+    merged_spans = []
+    for start_pos, end_pos in spans:
+        if merged_spans and start_pos <= merged_spans[-1][1]:
+            merged_spans[-1][1] = max(merged_spans[-1][1], end_pos)
+        else:
+            merged_spans.append([start_pos, end_pos])
     
-    # Also look for windows around procedure name if provided
-    if procedure_name:
-        proc_name_pattern = re.compile(r'\b' + re.escape(procedure_name.lower()) + r'\b')
-        for match in proc_name_pattern.finditer(text):
-            start_pos = max(0, match.start() - 500)
-            end_pos = min(len(text), match.end() + 500)
-            window = text[start_pos:end_pos]
-            cpt_positions.append((window, start_pos, end_pos))
-    
-    # Search for price patterns in the text windows
-    for window, _, _ in cpt_positions:
-        # Multiple patterns to catch different price formats
-        patterns = [
-            r'[\$]?\s?([0-9,]+(?:\.[0-9]{2})?)',  # Basic price pattern
-            r'cost[\s:]*[\$]?\s?([0-9,]+(?:\.[0-9]{2})?)',  # Cost: $XXX
-            r'price[\s:]*[\$]?\s?([0-9,]+(?:\.[0-9]{2})?)',  # Price: $XXX
-            r'charge[\s:]*[\$]?\s?([0-9,]+(?:\.[0-9]{2})?)',  # Charge: $XXX
-            r'fee[\s:]*[\$]?\s?([0-9,]+(?:\.[0-9]{2})?)',     # Fee: $XXX
-            r'rate[\s:]*[\$]?\s?([0-9,]+(?:\.[0-9]{2})?)',    # Rate: $XXX
-        ]
+    # Search for prices in the merged text windows. One money pattern
+    # replaces the old six-pattern loop (each prefixed variant matched a
+    # strict subset of the basic pattern, so they could never fire first),
+    # and NumPy does the range filter and middle-price pick in C instead of
+    # a Python loop per match
+    for start_pos, end_pos in merged_spans:
+        window = text[start_pos:end_pos]
+        price_matches = _MONEY_RE.findall(window)
+        if not price_matches:
+            continue
         
-        for pattern in patterns:
-            price_matches = re.findall(pattern, window)
-            
-            if price_matches:
-                valid_prices = []
-                for price_str in price_matches:
-                    # Clean up the price and convert to float
-                    price_str = price_str.replace(',', '')
-                    try:
-                        price = float(price_str)
-                        # Filter out unreasonable prices
-                        if 10 <= price <= 50000:  # Most medical procedures cost between $10 and $50,000
-                            valid_prices.append((price, window))
-                    except ValueError:
-                        pass
-                
-                # If valid prices found, return the most reasonable one
-                if valid_prices:
-                    # Sort by price (choose middle price to avoid extremes)
-                    valid_prices.sort(key=lambda x: x[0])
-                    if len(valid_prices) > 2:
-                        # Choose the middle price
-                        chosen_price, context = valid_prices[len(valid_prices)//2]
-                    else:
-                        # For 1-2 prices, choose the first (lowest)
-                        chosen_price, context = valid_prices[0]
-                        
-                    result["found"] = True
-                    result["price"] = chosen_price
-                    result["context"] = context
-                    return result
+        prices = np.fromiter((float(p.replace(',', '')) for p in price_matches),
+                             dtype=np.float64, count=len(price_matches))
+        # Filter out unreasonable prices; most medical procedures cost
+        # between $10 and $50,000
+        valid_prices = prices[(prices >= 10) & (prices <= 50000)]
+        
+        if valid_prices.size:
+            valid_prices.sort()
+            result["found"] = True
+            # Choose the middle price to avoid extremes; for 1-2 prices
+            # take the lowest
+            if valid_prices.size > 2:
+                result["price"] = float(valid_prices[valid_prices.size // 2])
+            else:
+                result["price"] = float(valid_prices[0])
+            result["context"] = window
+            return result
     
     return result
 
@@ -455,33 +904,35 @@ def _find_pdf_pricing_resources(pages: List[Dict[str, Any]], cpt_code: str, proc
     # Keywords that suggest a PDF might contain pricing information
     pricing_keywords = ["price", "charge", "cost", "rate", "fee", "financial", "transparency"]
     
+    # The crawl already recorded each page's anchors, so this pass is pure
+    # list filtering - no network traffic
     for page in pages:
-        try:
-            # Re-download the page to parse links
-            response = requests.get(page['url'], headers={"User-Agent": "HospitalInfoCrawler/1.0"}, timeout=5)
-            soup = BeautifulSoup(response.text, 'html.parser')
+        for full_url, link_text in page.get('anchors', []):
+            # Check if it's a PDF link with pricing keywords
+            is_pdf = full_url.lower().endswith('.pdf') or 'pdf' in full_url.lower()
+            has_price_keyword = any(keyword in link_text for keyword in pricing_keywords)
             
-            # Find all links
-            for link in soup.find_all('a', href=True):
-                href = link.get('href', '')
-                link_text = link.get_text().lower()
-                
-                # Check if it's a PDF link with pricing keywords
-                is_pdf = href.endswith('.pdf') or 'pdf' in href.lower()
-                has_price_keyword = any(keyword in link_text for keyword in pricing_keywords)
-                
-                if is_pdf and has_price_keyword:
-                    full_url = urljoin(page['url'], href)
-                    if full_url not in pdf_urls:
-                        pdf_urls.append(full_url)
-                        
-        except Exception:
-            continue
+            if is_pdf and has_price_keyword and full_url not in pdf_urls:
+                pdf_urls.append(full_url)
     
     return pdf_urls
 
+_EARTH_RADIUS_MILES = 3958.8
+
 def calculate_distance(lat1, lon1, lat2, lon2):
-    """Calculate distance between two geographic coordinates in miles."""
-    # You can implement a haversine formula here or use a library like geopy
-    # For simplicity, I'm not including the full implementation
-    return 1  # Placeholder
\ No newline at end of file
+    """Calculate the haversine distance between two coordinates in miles."""
+    lat1, lon1, lat2, lon2 = map(math.radians, (lat1, lon1, lat2, lon2))
+    a = (math.sin((lat2 - lat1) / 2) ** 2
+         + math.cos(lat1) * math.cos(lat2) * math.sin((lon2 - lon1) / 2) ** 2)
+    return 2 * _EARTH_RADIUS_MILES * math.asin(math.sqrt(a))
+
+def calculate_distances(lat1, lon1, lats, lons):
+    """Haversine distances in miles from one point to arrays of coordinates.
+
+    Vectorized counterpart of calculate_distance: one NumPy pass over the
+    whole coordinate set instead of per-point trig dispatch.
+    """
+    lat1, lon1, lats, lons = map(np.radians, (lat1, lon1, lats, lons))
+    a = (np.sin((lats - lat1) / 2) ** 2
+         + np.cos(lat1) * np.cos(lats) * np.sin((lons - lon1) / 2) ** 2)
+    return 2 * _EARTH_RADIUS_MILES * np.arcsin(np.sqrt(a))
\ No newline at end of file
@@ -1,11 +1,17 @@
 import argparse
 import logging
+import orjson
 import os
 import re
-import json
+import statistics
 import sys
+import threading
+import time
+from dataclasses import dataclass, field, asdict
 from datetime import datetime
 from collections import Counter
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from urllib.parse import urlparse
 
 from hospital_crawler import find_hospitals, find_procedure_pricing, setup_logging, crawl_hospital_website
 from hospital_analysis import (
@@ -17,6 +23,104 @@ from hospital_analysis import (
     analyze_website_content
 )
 
+# Tokenizer for URL pricing-term checks: splitting the URL once into a set of
+# alphabetic tokens makes each per-term check an O(1) set lookup instead of a
+# substring scan per term
+_URL_TOKEN_RE = re.compile(r'[a-z]+')
+
+# Known pricing terms to look for
+PRICING_TERMS = [
+    "price", "cost", "charge", "fee", "bill",
+    "payment", "estimate", "transparency",
+    "chargemaster", "financial"
+]
+_PRICING_TERM_SET = frozenset(PRICING_TERMS)
+
+# One combined alternation finds every term occurrence in a single pass over
+# the page text instead of one scan per term; longest-first ordering makes
+# overlapping terms (charge/chargemaster) resolve to the longest match
+_TERM_RE = re.compile('|'.join(map(re.escape, sorted(PRICING_TERMS, key=len, reverse=True))))
+
+# Candidate words for new-term discovery, compiled once instead of per context
+_WORD_RE = re.compile(r'\b[a-z]{4,15}\b')
+
+# Accepted shape for --cities arguments
+_CITY_STATE_RE = re.compile(r'^\s*([^,]+?)\s*,\s*([A-Za-z]{2})\s*$')
+
+def _city_state(value):
+    """argparse type for 'City,ST' arguments; returns a (city, state) tuple."""
+    match = _CITY_STATE_RE.match(value)
+    if not match:
+        raise argparse.ArgumentTypeError(
+            f"invalid city/state {value!r} (expected format: 'City,ST')")
+    return match.group(1), match.group(2).upper()
+
+# Domains whose crawl found zero pricing terms on a recent run; skipping
+# them avoids repeating the full 25-page crawl on sites known to be barren.
+# Entries expire after a week so newly published pricing pages still surface.
+_BARREN_CACHE_FILE = "barren_domains.json"
+_BARREN_TTL_SECONDS = 7 * 24 * 3600
+_barren_domains = {}
+
+def _load_barren_domains():
+    """Load the barren-domain cache, dropping entries past their TTL."""
+    try:
+        with open(_BARREN_CACHE_FILE, "rb") as f:
+            stored = orjson.loads(f.read())
+    except (OSError, orjson.JSONDecodeError):
+        return {}
+    cutoff = time.time() - _BARREN_TTL_SECONDS
+    return {domain: stamp for domain, stamp in stored.items() if stamp > cutoff}
+
+def _save_barren_domains():
+    with open(_BARREN_CACHE_FILE, "wb") as f:
+        f.write(orjson.dumps(_barren_domains))
+
+# Crawled pages cached per root domain: hospital chains share one corporate
+# site across many cities, so the same domain would otherwise be re-crawled
+# once per region it appears in
+_crawl_cache = {}
+_crawl_cache_lock = threading.Lock()
+_crawl_cache_hits = 0
+
+def _crawl_website_cached(hospital):
+    """Crawl a hospital website, reusing pages already fetched for its domain."""
+    global _crawl_cache_hits
+    logger = logging.getLogger(__name__)
+
+    key = urlparse(hospital['website']).netloc.lower().removeprefix('www.')
+    with _crawl_cache_lock:
+        pages = _crawl_cache.get(key)
+
+    if pages is None:
+        logger.info(f"Crawling {hospital['name']}: {hospital['website']}")
+        pages = crawl_hospital_website(hospital['website'], max_depth=3, max_pages=25)
+        with _crawl_cache_lock:
+            _crawl_cache[key] = pages
+    else:
+        logger.info(f"Reusing cached crawl of {key} for {hospital['name']}")
+        with _crawl_cache_lock:
+            _crawl_cache_hits += 1
+
+    return pages
+
+@dataclass(slots=True)
+class HospitalRecord:
+    """Per-hospital analysis record; slots keep the per-record footprint
+    small when region lists grow into the thousands."""
+    name: str
+    has_website: bool = False
+    pricing_depth: int | None = None
+    terms_found: list[str] = field(default_factory=list)
+
+def _json_default(obj):
+    """Serialize the Counter and record objects embedded in analysis results."""
+    if isinstance(obj, Counter):
+        return dict(obj)
+    if isinstance(obj, HospitalRecord):
+        return asdict(obj)
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
 def setup_output_directories(city: str, state: str, cpt_code: str, output_dir: str = "results"):
     """Create output directory structure based on search parameters and return file paths."""
     folder_name = f"{city.replace(' ', '_')}_{state.upper()}_{cpt_code}"
@@ -31,45 +135,100 @@ def setup_output_directories(city: str, state: str, cpt_code: str, output_dir: s
 
 def save_results_to_file(results, output_file="price_results.txt"):
     """Save the pricing results to a formatted text file"""
+    # Accumulate the report in memory and write it in one call instead of
+    # issuing dozens of tiny f.write() calls
+    parts = [
+        "=== HOSPITAL PROCEDURE PRICING RESULTS ===\n",
+        f"Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n\n"
+    ]
+
+    # Add search metrics section
+    if "metrics" in results:
+        metrics = results["metrics"]
+        parts.append("=== SEARCH METRICS ===\n")
+        parts.append(f"Total hospitals searched: {metrics['total_hospitals']}\n")
+        parts.append(f"Hospitals with websites: {metrics['hospitals_with_websites']}\n")
+        parts.append(f"Hospitals with prices found: {metrics['hospitals_with_prices']}\n")
+        parts.append(f"Overall success rate: {metrics['overall_success_rate']}%\n")
+        parts.append(f"Website search success rate: {metrics['website_success_rate']}%\n")
+
+        if "price_min" in metrics:
+            parts.append("\n=== PRICE STATISTICS ===\n")
+            parts.append(f"Lowest price: ${metrics['price_min']:.2f}\n")
+            parts.append(f"Highest price: ${metrics['price_max']:.2f}\n")
+            parts.append(f"Average price: ${metrics['price_avg']:.2f}\n")
+            parts.append(f"Median price: ${metrics['price_median']:.2f}\n")
+            parts.append(f"Price range: ${metrics['price_range']:.2f}\n")
+            parts.append(f"Price variance: ${metrics['price_variance']:.2f}\n")
+        parts.append("\n")
+
+    if results["best_price"] is not None:
+        parts.append("=== BEST PRICE FOUND ===\n")
+        parts.append(f"Price: ${results['best_price']:.2f}\n")
+        parts.append(f"Hospital: {results['hospital_name']}\n")
+        parts.append(f"Address: {results['hospital_address']}\n")
+        parts.append(f"Source: {results['source_url']}\n\n")
+
+        parts.append("=== ALL PRICES FOUND ===\n")
+        parts.extend(
+            f"{idx}. ${price_info['price']:.2f} - {price_info['hospital_name']}\n"
+            f"   Address: {price_info['hospital_address']}\n"
+            f"   Source: {price_info['source_url']}\n\n"
+            for idx, price_info in enumerate(results["all_prices"], 1)
+        )
+    else:
+        parts.append("No pricing information was found for this procedure.\n")
+        parts.append("Try searching with a different CPT code or procedure name.\n")
+
     with open(output_file, "w") as f:
-        f.write("=== HOSPITAL PROCEDURE PRICING RESULTS ===\n")
-        f.write(f"Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n\n")
-        
-        # Add search metrics section
-        if "metrics" in results:
-            metrics = results["metrics"]
-            f.write("=== SEARCH METRICS ===\n")
-            f.write(f"Total hospitals searched: {metrics['total_hospitals']}\n")
-            f.write(f"Hospitals with websites: {metrics['hospitals_with_websites']}\n")
-            f.write(f"Hospitals with prices found: {metrics['hospitals_with_prices']}\n")
-            f.write(f"Overall success rate: {metrics['overall_success_rate']}%\n")
-            f.write(f"Website search success rate: {metrics['website_success_rate']}%\n")
-            
-            if "price_min" in metrics:
-                f.write("\n=== PRICE STATISTICS ===\n")
-                f.write(f"Lowest price: ${metrics['price_min']:.2f}\n")
-                f.write(f"Highest price: ${metrics['price_max']:.2f}\n")
-                f.write(f"Average price: ${metrics['price_avg']:.2f}\n")
-                f.write(f"Median price: ${metrics['price_median']:.2f}\n")
-                f.write(f"Price range: ${metrics['price_range']:.2f}\n")
-                f.write(f"Price variance: ${metrics['price_variance']:.2f}\n")
-            f.write("\n")
-        
-        if results["best_price"] is not None:
-            f.write("=== BEST PRICE FOUND ===\n")
-            f.write(f"Price: ${results['best_price']:.2f}\n")
-            f.write(f"Hospital: {results['hospital_name']}\n")
-            f.write(f"Address: {results['hospital_address']}\n")
-            f.write(f"Source: {results['source_url']}\n\n")
-            
-            f.write("=== ALL PRICES FOUND ===\n")
-            for idx, price_info in enumerate(results["all_prices"], 1):
-                f.write(f"{idx}. ${price_info['price']:.2f} - {price_info['hospital_name']}\n")
-                f.write(f"   Address: {price_info['hospital_address']}\n")
-                f.write(f"   Source: {price_info['source_url']}\n\n")
-        else:
-            f.write("No pricing information was found for this procedure.\n")
-            f.write("Try searching with a different CPT code or procedure name.\n")
+        f.write("".join(parts))
+
+def _search_hospital(hospital, cpt_code, procedure_name, max_depth):
+    """Search a single hospital for procedure pricing.
+
+    Returns a (search_result, price_info) tuple where price_info is None if
+    no price was found. Safe to run from worker threads.
+    """
+    logger = logging.getLogger(__name__)
+
+    # Intern the name/address so the copies held by search_attempts,
+    # all_prices and the result dict all share one string object
+    name = sys.intern(hospital["name"])
+    address = sys.intern(hospital["address"])
+    search_result = {"hospital_name": name, "success": False, "has_website": False}
+    price_info = None
+
+    if hospital.get('website'):
+        search_result["has_website"] = True
+        logger.info(f"Searching {name}...")
+
+        try:
+            pricing = find_procedure_pricing(hospital['website'], cpt_code, procedure_name, max_depth)
+
+            if pricing["found"]:
+                price_info = {
+                    "price": pricing["price"],
+                    "hospital_name": name,
+                    "hospital_address": address,
+                    "source_url": pricing["source_url"],
+                    "context": pricing["context"]
+                }
+                search_result["success"] = True
+                search_result["price"] = pricing["price"]
+                logger.info(f"✓ Found price: ${pricing['price']} at {name}")
+            else:
+                logger.info(f"× No pricing found at {name}")
+                if pricing.get("pdf_links"):
+                    logger.info(f"  Found potential PDF resources: {len(pricing['pdf_links'])}")
+                    search_result["has_pdfs"] = True
+
+        except Exception as e:
+            logger.error(f"Error searching {name}: {e}")
+            search_result["error"] = str(e)
+    else:
+        logger.info(f"× Skipping {name} - No website available")
+
+    return search_result, price_info
 
 def find_best_procedure_price(city, state, cpt_code, procedure_name=None, max_depth=3):
     """Finds the best (lowest) price for a medical procedure across hospitals in a given location."""
@@ -97,46 +256,45 @@ def find_best_procedure_price(city, state, cpt_code, procedure_name=None, max_de
     
     all_prices = []
     search_attempts = []
-    
+    best_price_info = None
+
     logger.info(f"Searching for pricing of CPT {cpt_code} ({procedure_name or 'no name'}) in {city}, {state}")
     logger.info(f"Found {len(hospitals)} hospitals to search")
-    
+
+    # Hospital campuses that share one website would each trigger the same
+    # crawl; search one representative per domain and keep the no-website
+    # entries for the metrics
+    seen_domains = set()
+    to_search = []
     for hospital in hospitals:
-        search_result = {"hospital_name": hospital["name"], "success": False, "has_website": False}
-        
-        if hospital.get('website'):
-            search_result["has_website"] = True
-            logger.info(f"Searching {hospital['name']}...")
-            
-            try:
-                pricing = find_procedure_pricing(hospital['website'], cpt_code, procedure_name, max_depth)
-                
-                if pricing["found"]:
-                    price_info = {
-                        "price": pricing["price"],
-                        "hospital_name": hospital["name"],
-                        "hospital_address": hospital["address"],
-                        "source_url": pricing["source_url"],
-                        "context": pricing["context"]
-                    }
-                    all_prices.append(price_info)
-                    search_result["success"] = True
-                    search_result["price"] = pricing["price"]
-                    logger.info(f"✓ Found price: ${pricing['price']} at {hospital['name']}")
-                else:
-                    logger.info(f"× No pricing found at {hospital['name']}")
-                    if pricing.get("pdf_links"):
-                        logger.info(f"  Found potential PDF resources: {len(pricing['pdf_links'])}")
-                        search_result["has_pdfs"] = True
-            
-            except Exception as e:
-                logger.error(f"Error searching {hospital['name']}: {e}")
-                search_result["error"] = str(e)
-        else:
-            logger.info(f"× Skipping {hospital['name']} - No website available")
-        
-        search_attempts.append(search_result)
-    
+        website = hospital.get('website')
+        if website:
+            domain = urlparse(website if website.startswith(('http://', 'https://'))
+                              else 'https://' + website).netloc.lower().removeprefix('www.')
+            if domain in seen_domains:
+                logger.info(f"Skipping {hospital['name']}: shares {domain} with an already-queued hospital")
+                continue
+            seen_domains.add(domain)
+        to_search.append(hospital)
+
+    # Each hospital is an independent, network-bound crawl of a distinct
+    # domain, so run them concurrently instead of serializing the site crawls
+    max_workers = min(10, len(to_search))
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = [
+            executor.submit(_search_hospital, hospital, cpt_code, procedure_name, max_depth)
+            for hospital in to_search
+        ]
+        for future in as_completed(futures):
+            search_result, price_info = future.result()
+            search_attempts.append(search_result)
+            if price_info is not None:
+                all_prices.append(price_info)
+                # Track the best (lowest) price as results arrive instead
+                # of re-scanning all_prices at the end
+                if best_price_info is None or price_info["price"] < best_price_info["price"]:
+                    best_price_info = price_info
+
     metrics = calculate_search_metrics(hospitals, all_prices)
     
     unsuccessful_hospitals = [
@@ -149,9 +307,7 @@ def find_best_procedure_price(city, state, cpt_code, procedure_name=None, max_de
         for attempt in search_attempts if not attempt["success"]
     ]
     
-    if all_prices:
-        best_price_info = min(all_prices, key=lambda x: x["price"])
-        
+    if best_price_info is not None:
         return {
             "best_price": best_price_info["price"],
             "hospital_name": best_price_info["hospital_name"],
@@ -178,55 +334,144 @@ def find_best_procedure_price(city, state, cpt_code, procedure_name=None, max_de
 def run_comprehensive_analysis():
     """Run multiple types of analyses across different regions"""
     cities_states = [
-        ("Los Angeles", "CA"), 
+        ("Los Angeles", "CA"),
         ("Chicago", "IL"),
         ("Boston", "MA")
     ]
-    
+
+    # Fetch each region's hospital list once and share it across all five
+    # analyses instead of re-querying the hospital APIs per analyzer
+    hospitals_by_region = {(city, state): find_hospitals(city, state)
+                           for city, state in cities_states}
+
+    # Shared page cache: the structure, compliance and content analyses all
+    # walk the same websites, so each site is crawled once and the page list
+    # is reused by all three
+    page_cache = {}
+
     # 1. Analyze website structure
     structure_results = {}
     for city, state in cities_states:
-        structure_results[f"{city}, {state}"] = analyze_website_structure(city, state, "99213")
-    
+        structure_results[f"{city}, {state}"] = analyze_website_structure(
+            city, state, "99213", hospitals=hospitals_by_region[(city, state)],
+            page_cache=page_cache)
+
     # 2. Analyze compliance
-    compliance_results = analyze_transparency_compliance(cities_states)
-    
+    compliance_results = analyze_transparency_compliance(
+        cities_states, hospitals_by_region=hospitals_by_region, page_cache=page_cache)
+
     # 3. Analyze hospital distribution
     distribution_results = {}
     for city, state in cities_states:
-        distribution_results[f"{city}, {state}"] = analyze_geographic_distribution(city, state)
-    
+        distribution_results[f"{city}, {state}"] = analyze_geographic_distribution(
+            city, state, hospitals=hospitals_by_region[(city, state)])
+
     # 4. Analyze metadata
-    metadata_results = analyze_hospital_metadata(cities_states)
-    
+    metadata_results = analyze_hospital_metadata(cities_states, hospitals_by_region=hospitals_by_region)
+
     # 5. Analyze website content
     content_results = {}
     for city, state in cities_states:
-        content_results[f"{city}, {state}"] = analyze_website_content(city, state)
+        content_results[f"{city}, {state}"] = analyze_website_content(
+            city, state, hospitals=hospitals_by_region[(city, state)],
+            page_cache=page_cache)
     
     # Save all results
-    with open("comprehensive_analysis.json", "w") as f:
-        json.dump({
+    with open("comprehensive_analysis.json", "wb") as f:
+        f.write(orjson.dumps({
             "structure": structure_results,
             "compliance": compliance_results,
             "distribution": distribution_results,
             "metadata": metadata_results,
             "content": content_results
-        }, f, indent=2)
+        }, option=orjson.OPT_INDENT_2, default=_json_default))
+
+def _analyze_hospital_terms(hospital, pricing_terms):
+    """Crawl one hospital's website and scan its pages for pricing terms.
+
+    Returns (record, found_terms, min_depth, new_words) where
+    min_depth is None when no pricing language was found. Safe to run from
+    worker threads.
+    """
+    logger = logging.getLogger(__name__)
+
+    record = HospitalRecord(name=hospital["name"], has_website=True)
+
+    # Sites that produced no pricing language recently are not worth
+    # another full crawl
+    domain = urlparse(hospital['website']).netloc.lower().removeprefix('www.')
+    if domain in _barren_domains:
+        logger.info(f"Skipping {hospital['name']}: no pricing terms found on {domain} recently")
+        return record, Counter(), None, Counter()
+
+    # Crawl the website (single pass per domain)
+    pages = _crawl_website_cached(hospital)
+
+    # Track pricing info; min_depth is only meaningful once found_pricing
+    # is set, so a plain int placeholder avoids the float('inf') sentinel
+    found_pricing = False
+    min_depth = -1
+    found_terms = Counter()
+    new_words = Counter()
+
+    # Check each page
+    for page in pages:
+        text = page['text'].lower()
+        url = page['url'].lower()
+        depth = page['depth']
+        url_tokens = frozenset(_URL_TOKEN_RE.findall(url))
+
+        # Scan the page text once for all pricing terms, and intersect the
+        # URL tokens against the term set
+        matches = list(_TERM_RE.finditer(text))
+        page_terms = {m.group(0) for m in matches} | (_PRICING_TERM_SET & url_tokens)
+
+        if not page_terms:
+            continue
+
+        # Count each term seen on this page
+        found_terms.update(page_terms)
+
+        # Mark as pricing page if first occurrence
+        if not found_pricing:
+            found_pricing = True
+            min_depth = depth
+        elif depth < min_depth:
+            min_depth = depth
+
+        # Find context around each term occurrence for new term discovery
+        for match in matches:
+            start = max(0, match.start() - 30)
+            end = min(len(text), match.end() + 30)
+            context = text[start:end]
+
+            # Extract potential new terms
+            new_words.update(w for w in _WORD_RE.findall(context)
+                             if w not in _PRICING_TERM_SET)
+
+        # Once the homepage itself has matched and most of the vocabulary
+        # has been seen, deeper pages can't lower the depth - skip the
+        # remaining page scans
+        if min_depth == 0 and len(found_terms) >= len(pricing_terms) // 2:
+            break
+
+    # Record hospital results
+    if found_pricing:
+        record.pricing_depth = min_depth
+        record.terms_found = list(found_terms.keys())
+        return record, found_terms, min_depth, new_words
+
+    if pages and not found_terms:
+        _barren_domains[domain] = time.time()
+
+    return record, found_terms, None, new_words
 
 def analyze_hospital_pricing_terms(cities_states=None):
     """
     Analyze hospital websites for pricing terms and navigation depth in a single crawl
     """
-    # Set up logging
-    logging.basicConfig(
-        level=logging.INFO,
-        format='%(asctime)s - %(levelname)s - %(message)s',
-        handlers=[
-            logging.FileHandler("pricing_term_analysis.log"),
-            logging.StreamHandler()
-        ]
-    )
+    # Set up logging (queue-backed so logger calls stay cheap in crawl loops)
+    setup_logging("pricing_term_analysis.log")
     logger = logging.getLogger(__name__)
     
     # Default cities to analyze if none provided
@@ -246,12 +491,8 @@ def analyze_hospital_pricing_terms(cities_states=None):
         ]
     
     # Known pricing terms to look for
-    pricing_terms = [
-        "price", "cost", "charge", "fee", "bill", 
-        "payment", "estimate", "transparency",
-        "chargemaster", "financial"
-    ]
-    
+    pricing_terms = PRICING_TERMS
+
     # Track overall results
     results = {
         "regions": {},
@@ -265,10 +506,18 @@ def analyze_hospital_pricing_terms(cities_states=None):
     total_hospitals = 0
     hospitals_with_websites = 0
     hospitals_with_pricing = 0
-    context_words = set()
+    context_words = Counter()
     
     logger.info(f"Starting analysis for {len(cities_states)} regions")
-    
+
+    # Reload the negative cache so barren sites from earlier runs are skipped
+    global _barren_domains
+    _barren_domains = _load_barren_domains()
+
+    # Stream each region to a JSONL sidecar as it completes, so partial
+    # progress survives a crash instead of waiting for the final dump
+    jsonl_file = open("pricing_term_analysis.jsonl", "wb")
+
     # Analyze each region
     for city, state in cities_states:
         region_name = f"{city}, {state}"
@@ -288,101 +537,74 @@ def analyze_hospital_pricing_terms(cities_states=None):
         }
         
         depths = []
-        
-        # Process each hospital
+
+        # Bind the per-region containers once rather than re-indexing
+        # region_data for every hospital in the loops below
+        region_hospitals = region_data["hospitals"]
+        region_terms = region_data["terms"]
+        term_frequency = results["term_frequency"]
+
+        # Hospitals without a website need no crawl; record them directly
+        with_website = []
         for hospital in hospitals:
-            # Basic hospital info
-            hospital_data = {
-                "name": hospital["name"],
-                "has_website": False,
-                "pricing_depth": None,
-                "terms_found": []
-            }
-            
-            # Skip if no website
-            if not hospital.get('website'):
-                region_data["hospitals"].append(hospital_data)
-                continue
-            
-            # Count hospitals with websites
-            hospitals_with_websites += 1
-            region_data["with_website"] += 1
-            hospital_data["has_website"] = True
-            
-            try:
-                # Crawl the website (single pass)
-                logger.info(f"Crawling {hospital['name']}: {hospital['website']}")
-                pages = crawl_hospital_website(hospital['website'], max_depth=3, max_pages=25)
-                
-                # Track pricing info
-                found_pricing = False
-                min_depth = float('inf')
-                found_terms = Counter()
-                
-                # Check each page
-                for page in pages:
-                    text = page['text'].lower()
-                    url = page['url'].lower()
-                    depth = page['depth']
-                    
-                    # Look for pricing terms
-                    for term in pricing_terms:
-                        if term in text or term in url:
-                            # Count this term
-                            found_terms[term] += 1
-                            
-                            # Mark as pricing page if first occurrence
-                            if not found_pricing:
-                                found_pricing = True
-                                min_depth = depth
-                                hospitals_with_pricing += 1
-                                region_data["with_pricing"] += 1
-                            else:
-                                min_depth = min(min_depth, depth)
-                            
-                            # Find context around term for new term discovery
-                            for match in re.finditer(r'\b' + re.escape(term) + r'\b', text):
-                                start = max(0, match.start() - 30)
-                                end = min(len(text), match.end() + 30)
-                                context = text[start:end]
-                                
-                                # Extract potential new terms
-                                new_words = [w for w in re.findall(r'\b[a-z]{4,15}\b', context) 
-                                           if w not in pricing_terms and len(w) > 3]
-                                context_words.update(new_words)
-                
-                # Record hospital results
-                if found_pricing:
-                    hospital_data["pricing_depth"] = min_depth
-                    depths.append(min_depth)
-                    hospital_data["terms_found"] = list(found_terms.keys())
-                    
-                    # Update term counts
-                    region_data["terms"].update(found_terms)
-                    results["term_frequency"].update(found_terms)
-            
-            except Exception as e:
-                logger.error(f"Error analyzing {hospital['name']}: {e}")
-            
-            # Add this hospital's data
-            region_data["hospitals"].append(hospital_data)
-        
-        # Calculate depth statistics for this region
+            if hospital.get('website'):
+                with_website.append(hospital)
+            else:
+                region_hospitals.append(HospitalRecord(name=hospital["name"]))
+
+        hospitals_with_websites += len(with_website)
+        region_data["with_website"] += len(with_website)
+
+        # Crawl the region's hospitals concurrently; each crawl is an
+        # independent, network-bound site walk
+        if with_website:
+            with ThreadPoolExecutor(max_workers=min(8, len(with_website))) as executor:
+                futures = {
+                    executor.submit(_analyze_hospital_terms, hospital, pricing_terms): hospital
+                    for hospital in with_website
+                }
+                for future in as_completed(futures):
+                    hospital = futures[future]
+                    try:
+                        record, found_terms, min_depth, new_words = future.result()
+                    except Exception as e:
+                        logger.error(f"Error analyzing {hospital['name']}: {e}")
+                        record = HospitalRecord(name=hospital["name"], has_website=True)
+                    else:
+                        context_words.update(new_words)
+                        if min_depth is not None:
+                            hospitals_with_pricing += 1
+                            region_data["with_pricing"] += 1
+                            depths.append(min_depth)
+                            region_terms.update(found_terms)
+                            term_frequency.update(found_terms)
+
+                    # Add this hospital's data
+                    region_hospitals.append(record)
+
+        # Calculate depth statistics for this region; a single Counter pass
+        # replaces one list scan per depth bucket
         if depths:
+            depth_counts = Counter(depths)
+            distribution = {str(i): depth_counts.get(i, 0) for i in range(5)}
+            distribution["5+"] = sum(count for depth, count in depth_counts.items() if depth >= 5)
             results["navigation_depth"][region_name] = {
-                "avg": sum(depths) / len(depths),
+                "avg": statistics.fmean(depths),
                 "min": min(depths),
                 "max": max(depths),
-                "distribution": {str(i): depths.count(i) for i in range(5)}
+                "distribution": distribution
             }
-            results["navigation_depth"][region_name]["distribution"]["5+"] = sum(1 for d in depths if d >= 5)
         
         # Save region results
         results["regions"][region_name] = region_data
-    
+        jsonl_file.write(orjson.dumps({"region": region_name, **region_data},
+                                      default=_json_default) + b"\n")
+
+    jsonl_file.close()
+    _save_barren_domains()
+
     # Find potential new pricing terms
-    word_counts = Counter(context_words)
-    results["new_terms"] = [word for word, count in word_counts.most_common(30) if count > 2]
+    results["new_terms"] = [word for word, count in context_words.most_common(30) if count > 2]
     
     # Calculate overall statistics
     results["overall_stats"] = {
@@ -390,43 +612,43 @@ def analyze_hospital_pricing_terms(cities_states=None):
         "hospitals_with_websites": hospitals_with_websites,
         "hospitals_with_pricing": hospitals_with_pricing,
         "pricing_rate": round((hospitals_with_pricing / total_hospitals * 100), 1) if total_hospitals else 0,
+        "crawl_cache_hits": _crawl_cache_hits,
         "top_terms": results["term_frequency"].most_common(10)
     }
     
     # Save results to file
-    with open("pricing_term_analysis.json", "w") as f:
-        json.dump(results, f, indent=2, default=lambda obj: dict(obj) if isinstance(obj, Counter) else obj)
+    with open("pricing_term_analysis.json", "wb") as f:
+        f.write(orjson.dumps(results, option=orjson.OPT_INDENT_2, default=_json_default))
     
     logger.info(f"Analysis complete. Found pricing on {hospitals_with_pricing}/{total_hospitals} hospitals")
     return results
 
-def main():
+def _build_parser():
     parser = argparse.ArgumentParser(
         description="Analyze hospital websites for pricing terms and navigation depth."
     )
-    parser.add_argument("--cities", nargs='+', help="Cities to analyze (format: 'City,ST')")
-    args = parser.parse_args()
-    
-    # Parse custom cities if provided
-    cities_states = None
-    if args.cities:
-        cities_states = []
-        for city_state in args.cities:
-            if ',' in city_state:
-                city, state = city_state.split(',', 1)
-                cities_states.append((city.strip(), state.strip()))
+    parser.add_argument("--cities", nargs='+', type=_city_state,
+                        help="Cities to analyze (format: 'City,ST')")
+    return parser
+
+# Built once so scripted or repeated invocations reuse the same parser
+_PARSER = _build_parser()
+
+def main():
+    args = _PARSER.parse_args()
     
     # Run analysis
-    results = analyze_hospital_pricing_terms(cities_states)
+    results = analyze_hospital_pricing_terms(args.cities)
     
     # Display summary
+    stats = results["overall_stats"]
     print("\n=== HOSPITAL PRICING ANALYSIS ===")
-    print(f"Total hospitals: {results['overall_stats']['total_hospitals']}")
-    print(f"Hospitals with pricing: {results['overall_stats']['hospitals_with_pricing']}")
-    print(f"Pricing information rate: {results['overall_stats']['pricing_rate']}%")
+    print(f"Total hospitals: {stats['total_hospitals']}")
+    print(f"Hospitals with pricing: {stats['hospitals_with_pricing']}")
+    print(f"Pricing information rate: {stats['pricing_rate']}%")
     
     print("\nTop pricing terms:")
-    for term, count in results["overall_stats"]["top_terms"]:
+    for term, count in stats["top_terms"]:
         print(f"  - {term}: {count}")
     
     print("\nPotential new pricing terms:")